@@ -0,0 +1,171 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+#
+# Ahead-of-time compiled amortization kernels. app.py uses schedule_kernel in
+# place of its numba/NumPy _schedule_kernel, and app_par_actual.py uses
+# build_schedules_kernel in place of its numba _build_schedules_kernel, when
+# this module has been built with:
+#
+#     python setup.py build_ext --inplace
+
+import numpy as np
+
+# Must match DAILY_RATE_DENOMINATOR in app.py and app_par_actual.py
+# (100 * 365 * RATE_SCALE).
+cdef long long DAILY_RATE_DENOMINATOR = 100 * 365 * 1000000
+
+# Checked by both scripts on import; they fall back to their own kernel when
+# this build was compiled against a different rate scale.
+DAILY_RATE_DENOMINATOR_COMPILED = DAILY_RATE_DENOMINATOR
+
+
+cdef struct ScheduleStep:
+    long long daily_interest
+    long long interest
+    long long payment
+    long long principal
+    long long ending_balance
+
+
+cdef inline long long floor_div(long long numerator, long long denominator) nogil:
+    # Floor division, so a negative balance or rate rounds exactly like
+    # Python's // in the numba/NumPy kernel.
+    cdef long long quotient = numerator / denominator
+    if (numerator % denominator != 0) and ((numerator < 0) != (denominator < 0)):
+        quotient -= 1
+    return quotient
+
+
+cdef inline ScheduleStep schedule_step(
+    long long balance,
+    long long annual_rate_scaled,
+    long long days,
+    long long monthly_payment,
+    long long extra_interest,
+    bint is_last,
+) nogil:
+    cdef ScheduleStep step
+    cdef long long payoff
+    step.daily_interest = floor_div(
+        annual_rate_scaled * balance + DAILY_RATE_DENOMINATOR // 2,
+        DAILY_RATE_DENOMINATOR,
+    )
+    step.interest = step.daily_interest * days + extra_interest
+    payoff = balance + step.interest
+    # Conditional expressions rather than if-blocks, so the compiler can
+    # lower the payment cap and balance floor to conditional moves.
+    step.payment = payoff if is_last else min(monthly_payment + extra_interest, payoff)
+    step.principal = step.payment - step.interest
+    step.ending_balance = balance - step.principal
+    step.ending_balance = step.ending_balance if step.ending_balance > 0 else 0
+    return step
+
+
+def schedule_kernel(
+    const long long[:] loan_amounts,
+    const long long[:] monthly_payments,
+    const long long[:] annual_rates_scaled,
+    const long long[:] extra_interests,
+    const long long[:] periods_months,
+    const long long[:, :] day_counts,
+):
+    cdef Py_ssize_t loan_count = day_counts.shape[0]
+    cdef Py_ssize_t max_periods = day_counts.shape[1]
+    shape = (loan_count, max_periods)
+    beginning_balances = np.zeros(shape, dtype=np.int64)
+    daily_interests = np.zeros(shape, dtype=np.int64)
+    interests = np.zeros(shape, dtype=np.int64)
+    payments = np.zeros(shape, dtype=np.int64)
+    principals = np.zeros(shape, dtype=np.int64)
+    ending_balances = np.zeros(shape, dtype=np.int64)
+
+    cdef long long[:, :] beginning_view = beginning_balances
+    cdef long long[:, :] daily_view = daily_interests
+    cdef long long[:, :] interest_view = interests
+    cdef long long[:, :] payment_view = payments
+    cdef long long[:, :] principal_view = principals
+    cdef long long[:, :] ending_view = ending_balances
+
+    cdef Py_ssize_t loan, index, periods
+    cdef long long balance
+    cdef ScheduleStep step
+    with nogil:
+        for loan in range(loan_count):
+            balance = loan_amounts[loan]
+            periods = periods_months[loan]
+            for index in range(periods):
+                step = schedule_step(
+                    balance,
+                    annual_rates_scaled[loan],
+                    day_counts[loan, index],
+                    monthly_payments[loan],
+                    extra_interests[loan] if index == 0 else 0,
+                    index == periods - 1,
+                )
+                beginning_view[loan, index] = balance
+                daily_view[loan, index] = step.daily_interest
+                interest_view[loan, index] = step.interest
+                payment_view[loan, index] = step.payment
+                principal_view[loan, index] = step.principal
+                ending_view[loan, index] = step.ending_balance
+                balance = step.ending_balance
+
+    return (
+        beginning_balances,
+        daily_interests,
+        interests,
+        payments,
+        principals,
+        ending_balances,
+    )
+
+
+def build_schedules_kernel(
+    const long long[:] loan_offsets,
+    const long long[:] loan_amounts,
+    const long long[:] monthly_payments,
+    const long long[:] annual_rates_scaled,
+    const long long[:] extra_days,
+    const long long[:] days,
+    long long[:] beginning_balances,
+    long long[:] daily_interests,
+    long long[:] interests,
+    long long[:] payments,
+    long long[:] principals,
+    long long[:] extra_interests,
+    long long[:] ending_balances,
+):
+    # Loan i owns rows loan_offsets[i]:loan_offsets[i + 1] of the output
+    # columns; the first is its period 0 row. The extra days before the
+    # interest start are charged to period 1 at that period's daily interest.
+    cdef Py_ssize_t loan_count = loan_amounts.shape[0]
+    cdef Py_ssize_t loan, row, start, end
+    cdef long long balance, extra_interest
+    cdef ScheduleStep step
+    with nogil:
+        for loan in range(loan_count):
+            start = loan_offsets[loan]
+            end = loan_offsets[loan + 1]
+            balance = loan_amounts[loan]
+            extra_interest = floor_div(
+                annual_rates_scaled[loan] * balance + DAILY_RATE_DENOMINATOR // 2,
+                DAILY_RATE_DENOMINATOR,
+            ) * extra_days[loan]
+            beginning_balances[start] = balance
+            extra_interests[start] = extra_interest
+            ending_balances[start] = balance
+            for row in range(start + 1, end):
+                step = schedule_step(
+                    balance,
+                    annual_rates_scaled[loan],
+                    days[row],
+                    monthly_payments[loan],
+                    extra_interest if row == start + 1 else 0,
+                    row == end - 1,
+                )
+                beginning_balances[row] = balance
+                daily_interests[row] = step.daily_interest
+                interests[row] = step.interest
+                payments[row] = step.payment
+                principals[row] = step.principal
+                ending_balances[row] = step.ending_balance
+                balance = step.ending_balance
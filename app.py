@@ -1,18 +1,62 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import date, datetime
+from typing import Iterable, Iterator, NamedTuple
 from decimal import Decimal, ROUND_HALF_UP, getcontext
 import calendar
+import errno
+from itertools import chain
+from operator import itemgetter
+import os
+import sys
 from zipfile import BadZipFile
 
+import numpy as np
+
+try:
+    from numba import njit
+except ModuleNotFoundError:
+    # Without numba the kernel runs as plain NumPy.
+    def njit(*args: object, **kwargs: object):
+        def decorator(func):
+            return func
+
+        return decorator
+
+try:
+    # Optional ahead-of-time build of the kernel; see setup.py.
+    from _schedule import (
+        DAILY_RATE_DENOMINATOR_COMPILED as _COMPILED_DAILY_RATE_DENOMINATOR,
+        schedule_kernel as _compiled_schedule_kernel,
+    )
+except ImportError:
+    _compiled_schedule_kernel = None
+    _COMPILED_DAILY_RATE_DENOMINATOR = None
+
 
 getcontext().prec = 28
 
+# Rates are carried as integer millionths of a percent so the daily interest
+# calculation can stay in integer cents with exact ROUND_HALF_UP rounding.
+# Rates with more than 6 decimal places are rejected rather than rounded.
+RATE_SCALE = 10**6
+DAILY_RATE_DENOMINATOR = 100 * 365 * RATE_SCALE
+DAILY_RATE_HALF = DAILY_RATE_DENOMINATOR // 2
+
+# A build compiled against a different rate scale would round differently.
+if _COMPILED_DAILY_RATE_DENOMINATOR != DAILY_RATE_DENOMINATOR:
+    _compiled_schedule_kernel = None
+
+_CENT = Decimal("0.01")
+
 INPUT_LOANS_FILE = "loans.xlsx"
 INPUT_SHEET_NAME = "Sheet1"
 OUTPUT_EXCEL_FILE = "amortization_schedule.xlsx"
 OUTPUT_FINAL_ROWS_FILE = "amortization_final_rows.xlsx"
+PARALLEL_MIN_LOANS = 2000
 COLUMN_NAME_MAP = {
     "loan_number": "loan_number",
     "periods_months": "periods_months",
@@ -24,26 +68,49 @@ COLUMN_NAME_MAP = {
     "loan_amount": "loan_amount",
     "monthly_payment": "monthly_payment",
 }
-
-
-@dataclass
-class ScheduleRow:
+LOAN_FIELDS = (
+    "loan_number",
+    "periods_months",
+    "projected_close_date",
+    "interest_start_date",
+    "first_payment_date",
+    "cycle_day",
+    "annual_rate_percent",
+    "loan_amount",
+    "monthly_payment",
+)
+
+
+# Money fields are integer cents; see format_money and _cents_to_float.
+class ScheduleRow(NamedTuple):
     loan_number: str
     period: int
     payment_date: date | None
     days: int | None
     projected_close_date: date | None
-    beginning_balance: Decimal
-    daily_interest: Decimal | None
-    interest: Decimal | None
-    payment: Decimal | None
-    principal: Decimal | None
-    extra_interest: Decimal | None
-    ending_balance: Decimal
+    beginning_balance: int
+    daily_interest: int | None
+    interest: int | None
+    payment: int | None
+    principal: int | None
+    extra_interest: int | None
+    ending_balance: int
 
 
 def parse_date(value: str) -> date:
     value = value.strip()
+    if (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        try:
+            return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+        except ValueError:
+            raise ValueError(f"Unsupported date format: {value}") from None
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
         try:
             return datetime.strptime(value, fmt).date()
@@ -53,118 +120,293 @@ def parse_date(value: str) -> date:
 
 
 def quantize_money(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-
-def add_months(base_date: date, months: int, cycle_day: int) -> date:
-    month_index = base_date.month - 1 + months
-    year = base_date.year + month_index // 12
-    month = month_index % 12 + 1
-    last_day = calendar.monthrange(year, month)[1]
-    day = min(cycle_day, last_day)
-    return date(year, month, day)
-
-
-def build_schedule(
-    loan_number: str,
-    periods_months: int,
-    projected_close_date: date | None,
-    interest_start_date: date,
-    first_payment_date: date,
-    cycle_day: int,
-    annual_rate_percent: Decimal,
-    loan_amount: Decimal,
-    monthly_payment: Decimal,
-) -> list[ScheduleRow]:
-    rows: list[ScheduleRow] = []
-    balance = quantize_money(loan_amount)
-
-    rows.append(
-        ScheduleRow(
-            loan_number=loan_number,
-            period=0,
-            payment_date=interest_start_date,
-            days=None,
-            projected_close_date=projected_close_date,
-            beginning_balance=balance,
-            daily_interest=None,
-            interest=None,
-            payment=None,
-            principal=None,
-            extra_interest=None,
-            ending_balance=balance,
-        )
-    )
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
 
-    extra_interest: Decimal | None = None
-    if projected_close_date:
-        extra_days = (interest_start_date - projected_close_date).days
-        if extra_days < 0:
-            extra_days = 0
-        extra_daily_interest = quantize_money(
-            (annual_rate_percent / Decimal(100)) * balance / Decimal(365)
-        )
-        extra_interest = quantize_money(extra_daily_interest * Decimal(extra_days))
-        rows[0].extra_interest = extra_interest
 
-    previous_date = interest_start_date
-    for period in range(1, periods_months + 1):
-        if period == 1:
-            payment_date = first_payment_date
-        else:
-            payment_date = add_months(first_payment_date, period - 1, cycle_day)
+def to_cents(value: Decimal) -> int:
+    return int(quantize_money(value).scaleb(2))
+
 
-        days = (payment_date - previous_date).days
-        daily_interest = quantize_money(
-            (annual_rate_percent / Decimal(100)) * balance / Decimal(365)
+def to_rate_scaled(annual_rate_percent: Decimal) -> int:
+    scaled = annual_rate_percent * RATE_SCALE
+    if scaled != scaled.to_integral_value():
+        raise ValueError(
+            f"Unsupported rate precision: {annual_rate_percent} (at most 6 decimal places)"
         )
-        interest = quantize_money(daily_interest * Decimal(days))
-        if period == 1 and extra_interest is not None:
-            interest = quantize_money(interest + extra_interest)
-
-        payment = monthly_payment
-        if period == 1 and extra_interest is not None:
-            payment = payment + extra_interest
-        if period == periods_months:
-            payment = balance + interest
-        elif payment > balance + interest:
-            payment = balance + interest
+    return int(scaled)
+
+
+def _cents_to_float(cents: int | None) -> float | None:
+    return None if cents is None else cents / 100
+
+
+def daily_interest_cents(balance: int, annual_rate_scaled: int) -> int:
+    numerator = annual_rate_scaled * balance
+    return (numerator + DAILY_RATE_HALF) // DAILY_RATE_DENOMINATOR
+
+
+_MONTH_LAST_DAY: dict[tuple[int, int], int] = {}
+
+
+def _month_last_day(year: int, month: int) -> int:
+    last_day = _MONTH_LAST_DAY.get((year, month))
+    if last_day is None:
+        last_day = _MONTH_LAST_DAY[(year, month)] = calendar.monthrange(year, month)[1]
+    return last_day
+
+
+def _payment_dates(first_payment_date: date, cycle_day: int, periods: int) -> list[date]:
+    if periods <= 0:
+        return []
+    dates = [first_payment_date]
+    year = first_payment_date.year
+    month = first_payment_date.month
+    for _ in range(periods - 1):
+        if month == 12:
+            year += 1
+            month = 1
+        else:
+            month += 1
+        dates.append(date(year, month, min(cycle_day, _month_last_day(year, month))))
+    return dates
+
+
+@njit(cache=True)
+def _schedule_kernel(
+    loan_amounts: np.ndarray,
+    monthly_payments: np.ndarray,
+    annual_rates_scaled: np.ndarray,
+    extra_interests: np.ndarray,
+    periods_months: np.ndarray,
+    day_counts: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    # Every loan advances one period per step; day_counts is padded with
+    # zeros past each loan's term and those cells are never read back.
+    shape = day_counts.shape
+    beginning_balances = np.zeros(shape, dtype=np.int64)
+    daily_interests = np.zeros(shape, dtype=np.int64)
+    interests = np.zeros(shape, dtype=np.int64)
+    payments = np.zeros(shape, dtype=np.int64)
+    principals = np.zeros(shape, dtype=np.int64)
+    ending_balances = np.zeros(shape, dtype=np.int64)
+
+    balance = loan_amounts.copy()
+    for index in range(shape[1]):
+        daily_interest = (
+            annual_rates_scaled * balance + DAILY_RATE_HALF
+        ) // DAILY_RATE_DENOMINATOR
+        interest = daily_interest * day_counts[:, index]
+        payment = monthly_payments
+        if index == 0:
+            interest = interest + extra_interests
+            payment = payment + extra_interests
+        payoff = balance + interest
+        payment = np.where(periods_months == index + 1, payoff, np.minimum(payment, payoff))
 
         principal = payment - interest
-        ending_balance = quantize_money(balance - principal)
-        if ending_balance < Decimal("0.00"):
-            ending_balance = Decimal("0.00")
-
-        rows.append(
-            ScheduleRow(
-                loan_number=loan_number,
-                period=period,
-                payment_date=payment_date,
-                days=days,
-                projected_close_date=None,
-                beginning_balance=balance,
-                daily_interest=daily_interest,
-                interest=interest,
-                payment=payment,
-                principal=principal,
-                extra_interest=None,
-                ending_balance=ending_balance,
+        ending_balance = np.maximum(balance - principal, 0)
+
+        beginning_balances[:, index] = balance
+        daily_interests[:, index] = daily_interest
+        interests[:, index] = interest
+        payments[:, index] = payment
+        principals[:, index] = principal
+        ending_balances[:, index] = ending_balance
+        balance = ending_balance
+
+    return (
+        beginning_balances,
+        daily_interests,
+        interests,
+        payments,
+        principals,
+        ending_balances,
+    )
+
+
+# Column-oriented schedules for every loan: per-loan inputs are 1-D arrays
+# and per-period results are (n_loans, max_periods) int64 arrays of cents.
+# Payment dates are kept as date ordinals so worker results pickle cheaply.
+@dataclass
+class LoanSchedules:
+    loan_numbers: list[str]
+    projected_close_dates: list[date | None]
+    interest_start_dates: list[date]
+    payment_dates: np.ndarray
+    periods_months: np.ndarray
+    loan_amounts: np.ndarray
+    extra_interests: list[int | None]
+    day_counts: np.ndarray
+    beginning_balances: np.ndarray
+    daily_interests: np.ndarray
+    interests: np.ndarray
+    payments: np.ndarray
+    principals: np.ndarray
+    ending_balances: np.ndarray
+
+
+def build_schedules(loans: list[dict[str, object]]) -> LoanSchedules:
+    loan_count = len(loans)
+    max_periods = max((loan["periods_months"] for loan in loans), default=0)
+    # A negative term gets just its period 0 row, like a zero one.
+    max_periods = max(max_periods, 0)
+    day_counts = np.zeros((loan_count, max_periods), dtype=np.int64)
+    payment_dates = np.zeros((loan_count, max_periods), dtype=np.int64)
+    extra_interests: list[int | None] = []
+
+    for loan_index, loan in enumerate(loans):
+        interest_start_date = loan["interest_start_date"]
+        projected_close_date = loan["projected_close_date"]
+        first_payment_date = loan["first_payment_date"]
+
+        extra_interest: int | None = None
+        if projected_close_date:
+            extra_days = (interest_start_date - projected_close_date).days
+            if extra_days < 0:
+                extra_days = 0
+            extra_daily_interest = daily_interest_cents(
+                loan["loan_amount"], loan["annual_rate_percent"]
             )
-        )
+            extra_interest = extra_daily_interest * extra_days
+        extra_interests.append(extra_interest)
+
+        dates = _payment_dates(first_payment_date, loan["cycle_day"], loan["periods_months"])
+        previous_ordinal = interest_start_date.toordinal()
+        for period_index, payment_date in enumerate(dates):
+            ordinal = payment_date.toordinal()
+            payment_dates[loan_index, period_index] = ordinal
+            day_counts[loan_index, period_index] = ordinal - previous_ordinal
+            previous_ordinal = ordinal
+
+    loan_amounts = np.array([loan["loan_amount"] for loan in loans], dtype=np.int64)
+    periods_months = np.array([loan["periods_months"] for loan in loans], dtype=np.int64)
+    kernel = _compiled_schedule_kernel or _schedule_kernel
+    columns = kernel(
+        loan_amounts,
+        np.array([loan["monthly_payment"] for loan in loans], dtype=np.int64),
+        np.array([loan["annual_rate_percent"] for loan in loans], dtype=np.int64),
+        np.array([extra or 0 for extra in extra_interests], dtype=np.int64),
+        periods_months,
+        day_counts,
+    )
 
-        balance = ending_balance
-        previous_date = payment_date
+    return LoanSchedules(
+        [loan["loan_number"] for loan in loans],
+        [loan["projected_close_date"] for loan in loans],
+        [loan["interest_start_date"] for loan in loans],
+        payment_dates,
+        periods_months,
+        loan_amounts,
+        extra_interests,
+        day_counts,
+        *columns,
+    )
 
-    return rows
 
+def _concat_schedules(parts: list[LoanSchedules]) -> LoanSchedules:
+    max_periods = max((part.day_counts.shape[1] for part in parts), default=0)
+    merged: list[object] = []
+    for field in fields(LoanSchedules):
+        values = [getattr(part, field.name) for part in parts]
+        if isinstance(values[0], list):
+            merged.append(list(chain.from_iterable(values)))
+        elif values[0].ndim == 1:
+            merged.append(np.concatenate(values))
+        else:
+            merged.append(
+                np.concatenate(
+                    [
+                        np.pad(value, ((0, 0), (0, max_periods - value.shape[1])))
+                        for value in values
+                    ]
+                )
+            )
+    return LoanSchedules(*merged)
+
+
+def build_schedules_parallel(
+    loans: list[dict[str, object]], max_workers: int | None = None
+) -> LoanSchedules:
+    # Loans are independent, so large portfolios are split into chunks and
+    # built in worker processes. Small ones are not worth the process start-up.
+    if len(loans) < PARALLEL_MIN_LOANS:
+        return build_schedules(loans)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1:
+        return build_schedules(loans)
+    chunk_size = max(1, len(loans) // (4 * workers))
+    chunks = [loans[start : start + chunk_size] for start in range(0, len(loans), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(build_schedules, chunks))
+    return _concat_schedules(parts)
+
+
+def iter_schedule_rows(schedules: LoanSchedules) -> Iterator[ScheduleRow]:
+    loan_amounts = schedules.loan_amounts.tolist()
+    periods_months = schedules.periods_months.tolist()
+    for loan_index, loan_number in enumerate(schedules.loan_numbers):
+        periods = max(periods_months[loan_index], 0)
+        dates = map(date.fromordinal, schedules.payment_dates[loan_index, :periods].tolist())
+        yield ScheduleRow(
+            loan_number,
+            0,
+            schedules.interest_start_dates[loan_index],
+            None,
+            schedules.projected_close_dates[loan_index],
+            loan_amounts[loan_index],
+            None,
+            None,
+            None,
+            None,
+            schedules.extra_interests[loan_index],
+            loan_amounts[loan_index],
+        )
 
-def format_money(value: Decimal | None) -> str:
+        columns = zip(
+            dates,
+            schedules.day_counts[loan_index, :periods].tolist(),
+            schedules.beginning_balances[loan_index, :periods].tolist(),
+            schedules.daily_interests[loan_index, :periods].tolist(),
+            schedules.interests[loan_index, :periods].tolist(),
+            schedules.payments[loan_index, :periods].tolist(),
+            schedules.principals[loan_index, :periods].tolist(),
+            schedules.ending_balances[loan_index, :periods].tolist(),
+        )
+        for period, values in enumerate(columns, start=1):
+            (
+                payment_date,
+                days,
+                beginning_balance,
+                daily_interest,
+                interest,
+                payment,
+                principal,
+                ending_balance,
+            ) = values
+            yield ScheduleRow(
+                loan_number,
+                period,
+                payment_date,
+                days,
+                None,
+                beginning_balance,
+                daily_interest,
+                interest,
+                payment,
+                principal,
+                None,
+                ending_balance,
+            )
+
+
+def format_money(value: int | None) -> str:
     if value is None:
         return ""
-    return f"{value:,.2f}"
+    return f"{value / 100:,.2f}"
 
 
-def display_schedule(rows: list[ScheduleRow]) -> None:
+def display_schedule(rows: Iterable[ScheduleRow]) -> None:
     headers = [
         "Loan #",
         "Period",
@@ -180,110 +422,169 @@ def display_schedule(rows: list[ScheduleRow]) -> None:
         "End Balance",
     ]
     widths = [8, 6, 12, 6, 18, 14, 14, 12, 12, 12, 14, 14]
-    header_row = "  ".join(h.ljust(w) for h, w in zip(headers, widths))
-    print(header_row)
-    print("-" * len(header_row))
+    format_line = "  ".join(f"{{:<{width}}}" for width in widths).format
+    header_row = format_line(*headers)
+    lines = [header_row, "-" * len(header_row)]
+
+    for (
+        loan_number,
+        period,
+        payment_date,
+        days,
+        projected_close_date,
+        *amounts,
+    ) in rows:
+        lines.append(
+            format_line(
+                loan_number,
+                str(period),
+                payment_date.isoformat() if payment_date else "",
+                "" if days is None else str(days),
+                projected_close_date.isoformat() if projected_close_date else "",
+                *map(format_money, amounts),
+            )
+        )
 
-    for row in rows:
-        values = [
-            row.loan_number,
-            str(row.period),
-            row.payment_date.isoformat() if row.payment_date else "",
-            "" if row.days is None else str(row.days),
-            row.projected_close_date.isoformat() if row.projected_close_date else "",
-            format_money(row.beginning_balance),
-            format_money(row.daily_interest),
-            format_money(row.interest),
-            format_money(row.payment),
-            format_money(row.principal),
-            format_money(row.extra_interest),
-            format_money(row.ending_balance),
-        ]
-        line = "  ".join(v.ljust(w) for v, w in zip(values, widths))
-        print(line)
+    # One write instead of a print() per row, which is dominated by stdout
+    # locking and flushing on large portfolios.
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
-def load_loans(
-    file_path: str, sheet_name: str, column_map: dict[str, str]
-) -> list[dict[str, object]]:
+def as_text(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        # calamine reports every numeric cell as a float.
+        return str(int(value))
+    return str(value).strip()
+
+
+def _read_sheet_rows(file_path: str, sheet_name: str) -> Iterator[tuple[object, ...]]:
+    try:
+        from python_calamine import CalamineError, CalamineWorkbook, WorksheetNotFound
+    except ModuleNotFoundError:
+        CalamineWorkbook = None
+
+    if CalamineWorkbook is not None:
+        # Raise the same errors as the openpyxl path below: calamine reports a
+        # missing file as a bare OSError and a missing sheet as its own error.
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
+        try:
+            workbook = CalamineWorkbook.from_path(file_path)
+        except CalamineError as exc:
+            raise ValueError("Input file is not a valid Excel workbook.") from exc
+        try:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+        except WorksheetNotFound as exc:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.") from exc
+        return iter(sheet.to_python(skip_empty_area=False))
+
     try:
         from openpyxl import load_workbook
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
-            "openpyxl is required to read Excel files. Install with: pip install openpyxl"
+            "python-calamine or openpyxl is required to read Excel files. "
+            "Install with: pip install python-calamine"
         ) from exc
 
-    lower_path = file_path.lower()
-    if not (lower_path.endswith(".xlsx") or lower_path.endswith(".xlsm")):
-        raise ValueError("Input file must be an .xlsx or .xlsm Excel file.")
-
     try:
         workbook = load_workbook(file_path, read_only=True, data_only=True)
     except BadZipFile as exc:
         raise ValueError("Input file is not a valid Excel workbook.") from exc
+    return workbook[sheet_name].iter_rows(values_only=True)
+
+
+def to_date(value: object) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return parse_date(str(value))
+
+
+def load_loans(
+    file_path: str, sheet_name: str, column_map: dict[str, str]
+) -> list[dict[str, object]]:
+    lower_path = file_path.lower()
+    if not (lower_path.endswith(".xlsx") or lower_path.endswith(".xlsm")):
+        raise ValueError("Input file must be an .xlsx or .xlsm Excel file.")
 
-    sheet = workbook[sheet_name]
-    rows_iter = sheet.iter_rows(values_only=True)
+    rows_iter = _read_sheet_rows(file_path, sheet_name)
     header_row = next(rows_iter, None)
     if header_row is None:
         return []
 
     headers = [str(value).strip() if value is not None else "" for value in header_row]
     header_index = {name: idx for idx, name in enumerate(headers)}
-
-    def cell_value(row_values: tuple[object, ...], key: str) -> object:
-        column_name = column_map[key]
-        index = header_index[column_name]
-        return row_values[index]
+    loan_values = itemgetter(*(header_index[column_map[field]] for field in LOAN_FIELDS))
 
     loans: list[dict[str, object]] = []
     for row_values in rows_iter:
-        def as_text(value: object) -> str:
-            if isinstance(value, datetime):
-                return value.date().isoformat()
-            if isinstance(value, date):
-                return value.isoformat()
-            return str(value).strip()
-
+        (
+            loan_number,
+            periods_months,
+            projected_close_date,
+            interest_start_date,
+            first_payment_date,
+            cycle_day,
+            annual_rate_percent,
+            loan_amount,
+            monthly_payment,
+        ) = loan_values(row_values)
         loans.append(
             {
-                "loan_number": as_text(cell_value(row_values, "loan_number")),
-                "periods_months": int(as_text(cell_value(row_values, "periods_months"))),
-                "projected_close_date": parse_date(
-                    as_text(cell_value(row_values, "projected_close_date"))
-                ),
-                "interest_start_date": parse_date(
-                    as_text(cell_value(row_values, "interest_start_date"))
-                ),
-                "first_payment_date": parse_date(
-                    as_text(cell_value(row_values, "first_payment_date"))
-                ),
-                "cycle_day": int(as_text(cell_value(row_values, "cycle_day"))),
-                "annual_rate_percent": Decimal(
-                    as_text(cell_value(row_values, "annual_rate_percent"))
-                ),
-                "loan_amount": Decimal(as_text(cell_value(row_values, "loan_amount"))),
-                "monthly_payment": Decimal(
-                    as_text(cell_value(row_values, "monthly_payment"))
-                ),
+                "loan_number": as_text(loan_number),
+                "periods_months": int(as_text(periods_months)),
+                "projected_close_date": to_date(projected_close_date),
+                "interest_start_date": to_date(interest_start_date),
+                "first_payment_date": to_date(first_payment_date),
+                "cycle_day": int(as_text(cycle_day)),
+                "annual_rate_percent": to_rate_scaled(Decimal(as_text(annual_rate_percent))),
+                "loan_amount": to_cents(Decimal(as_text(loan_amount))),
+                "monthly_payment": to_cents(Decimal(as_text(monthly_payment))),
             }
         )
     return loans
 
 
-def export_schedule_excel(rows: list[ScheduleRow], file_path: str) -> None:
+def _open_excel_sheet(
+    file_path: str,
+    sheet_name: str,
+    headers: list[str],
+    money_columns: list[tuple[int, int]],
+):
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import numbers
+        import xlsxwriter
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
-            "openpyxl is required to export Excel files. Install with: pip install openpyxl"
+            "xlsxwriter is required to export Excel files. Install with: pip install xlsxwriter"
         ) from exc
 
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Amortization"
+    # constant_memory flushes each row to disk once the next row starts, so
+    # an export is never held in memory as a whole workbook. Dates pick up
+    # default_date_format; the text and money formats are set per column.
+    workbook = xlsxwriter.Workbook(
+        file_path,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd",
+            "strings_to_urls": False,
+        },
+    )
+    sheet = workbook.add_worksheet(sheet_name)
+    sheet.set_column(0, 0, None, workbook.add_format({"num_format": "@"}))
+    money = workbook.add_format({"num_format": "0.00"})
+    for first_column, last_column in money_columns:
+        sheet.set_column(first_column, last_column, None, money)
+    sheet.write_row(0, 0, headers, workbook.add_format())
+    return workbook, sheet
 
+
+def export_schedule_excel(schedules: LoanSchedules, file_path: str) -> None:
     headers = [
         "Loan #",
         "Period",
@@ -298,55 +599,84 @@ def export_schedule_excel(rows: list[ScheduleRow], file_path: str) -> None:
         "Extra Interest",
         "End Balance",
     ]
-    sheet.append(headers)
-
-    for row in rows:
-        sheet.append(
-            [
-                row.loan_number,
-                row.period,
-                row.payment_date,
-                row.days,
-                row.projected_close_date,
-                float(row.beginning_balance) if row.beginning_balance is not None else None,
-                float(row.daily_interest) if row.daily_interest is not None else None,
-                float(row.interest) if row.interest is not None else None,
-                float(row.payment) if row.payment is not None else None,
-                float(row.principal) if row.principal is not None else None,
-                float(row.extra_interest) if row.extra_interest is not None else None,
-                float(row.ending_balance) if row.ending_balance is not None else None,
-            ]
+    workbook, sheet = _open_excel_sheet(file_path, "Amortization", headers, [(5, 11)])
+
+    # Convert each cents column to dollars once, then stream plain floats.
+    money_columns = [
+        column / 100
+        for column in (
+            schedules.beginning_balances,
+            schedules.daily_interests,
+            schedules.interests,
+            schedules.payments,
+            schedules.principals,
+            schedules.ending_balances,
         )
+    ]
+    loan_amounts = (schedules.loan_amounts / 100).tolist()
+    periods_months = schedules.periods_months.tolist()
+    row_index = 1
+    for loan_index, loan_number in enumerate(schedules.loan_numbers):
+        periods = max(periods_months[loan_index], 0)
+        dates = map(date.fromordinal, schedules.payment_dates[loan_index, :periods].tolist())
+        sheet.write_row(
+            row_index,
+            0,
+            (
+                loan_number,
+                0,
+                schedules.interest_start_dates[loan_index],
+                None,
+                schedules.projected_close_dates[loan_index],
+                loan_amounts[loan_index],
+                None,
+                None,
+                None,
+                None,
+                _cents_to_float(schedules.extra_interests[loan_index]),
+                loan_amounts[loan_index],
+            ),
+        )
+        row_index += 1
 
-    for cell in sheet["A"][1:]:
-        cell.number_format = numbers.FORMAT_TEXT
-
-    for cell in sheet["C"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
-
-    for cell in sheet["E"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
-
-    for column in ["F", "G", "H", "I", "J", "K", "L"]:
-        for cell in sheet[column][1:]:
-            cell.number_format = numbers.FORMAT_NUMBER_00
+        columns = zip(
+            dates,
+            schedules.day_counts[loan_index, :periods].tolist(),
+            *(column[loan_index, :periods].tolist() for column in money_columns),
+        )
+        for period, (payment_date, days, *amounts) in enumerate(columns, start=1):
+            (
+                beginning_balance,
+                daily_interest,
+                interest,
+                payment,
+                principal,
+                ending_balance,
+            ) = amounts
+            sheet.write_row(
+                row_index,
+                0,
+                (
+                    loan_number,
+                    period,
+                    payment_date,
+                    days,
+                    None,
+                    beginning_balance,
+                    daily_interest,
+                    interest,
+                    payment,
+                    principal,
+                    None,
+                    ending_balance,
+                ),
+            )
+            row_index += 1
 
-    workbook.save(file_path)
+    workbook.close()
 
 
-def export_final_rows_excel(rows: list[ScheduleRow], file_path: str) -> None:
-    try:
-        from openpyxl import Workbook
-        from openpyxl.styles import numbers
-    except ModuleNotFoundError as exc:
-        raise ModuleNotFoundError(
-            "openpyxl is required to export Excel files. Install with: pip install openpyxl"
-        ) from exc
-
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Final Rows"
-
+def export_final_rows_excel(rows: Iterable[ScheduleRow], file_path: str) -> None:
     headers = [
         "Loan #",
         "First Payment Date",
@@ -369,87 +699,69 @@ def export_final_rows_excel(rows: list[ScheduleRow], file_path: str) -> None:
         "Final Extra Interest",
         "Final End Balance",
     ]
-    sheet.append(headers)
+    workbook, sheet = _open_excel_sheet(
+        file_path, "Final Rows", headers, [(4, 10), (13, 19)]
+    )
 
     first_payment_by_loan: dict[str, ScheduleRow] = {}
     final_by_loan: dict[str, ScheduleRow] = {}
     for row in rows:
-        final_by_loan[row.loan_number] = row
-        if row.period == 1 and row.loan_number not in first_payment_by_loan:
-            first_payment_by_loan[row.loan_number] = row
-
-    def to_float(value: Decimal | None) -> float | None:
-        if value is None:
-            return None
-        return float(value)
+        loan_number = row.loan_number
+        final_by_loan[loan_number] = row
+        if row.period == 1:
+            first_payment_by_loan.setdefault(loan_number, row)
 
-    for loan_number, final_row in final_by_loan.items():
+    for row_index, (loan_number, final_row) in enumerate(final_by_loan.items(), start=1):
         first_row = first_payment_by_loan.get(loan_number)
-        sheet.append(
-            [
+        sheet.write_row(
+            row_index,
+            0,
+            (
                 loan_number,
                 first_row.payment_date if first_row else None,
                 first_row.days if first_row else None,
                 first_row.projected_close_date if first_row else None,
-                to_float(first_row.beginning_balance) if first_row else None,
-                to_float(first_row.daily_interest) if first_row else None,
-                to_float(first_row.interest) if first_row else None,
-                to_float(first_row.payment) if first_row else None,
-                to_float(first_row.principal) if first_row else None,
-                to_float(first_row.extra_interest) if first_row else None,
-                to_float(first_row.ending_balance) if first_row else None,
+                _cents_to_float(first_row.beginning_balance) if first_row else None,
+                _cents_to_float(first_row.daily_interest) if first_row else None,
+                _cents_to_float(first_row.interest) if first_row else None,
+                _cents_to_float(first_row.payment) if first_row else None,
+                _cents_to_float(first_row.principal) if first_row else None,
+                _cents_to_float(first_row.extra_interest) if first_row else None,
+                _cents_to_float(first_row.ending_balance) if first_row else None,
                 final_row.payment_date if final_row else None,
                 final_row.days if final_row else None,
-                to_float(final_row.beginning_balance) if final_row else None,
-                to_float(final_row.daily_interest) if final_row else None,
-                to_float(final_row.interest) if final_row else None,
-                to_float(final_row.payment) if final_row else None,
-                to_float(final_row.principal) if final_row else None,
-                to_float(final_row.extra_interest) if final_row else None,
-                to_float(final_row.ending_balance) if final_row else None,
-            ]
+                _cents_to_float(final_row.beginning_balance) if final_row else None,
+                _cents_to_float(final_row.daily_interest) if final_row else None,
+                _cents_to_float(final_row.interest) if final_row else None,
+                _cents_to_float(final_row.payment) if final_row else None,
+                _cents_to_float(final_row.principal) if final_row else None,
+                _cents_to_float(final_row.extra_interest) if final_row else None,
+                _cents_to_float(final_row.ending_balance) if final_row else None,
+            ),
         )
 
-    for cell in sheet["A"][1:]:
-        cell.number_format = numbers.FORMAT_TEXT
-
-    for cell in sheet["B"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
+    workbook.close()
 
-    for cell in sheet["D"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
-
-    for cell in sheet["L"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
-
-    for column in ["E", "F", "G", "H", "I", "J", "K", "N", "O", "P", "Q", "R", "S", "T"]:
-        for cell in sheet[column][1:]:
-            cell.number_format = numbers.FORMAT_NUMBER_00
-
-    workbook.save(file_path)
 
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=f"Build amortization schedules for the loans in {INPUT_LOANS_FILE}."
+    )
+    parser.add_argument(
+        "--no-display",
+        action="store_true",
+        help="skip printing every schedule row to stdout",
+    )
+    args = parser.parse_args(argv)
 
-def main() -> None:
     loans = load_loans(INPUT_LOANS_FILE, INPUT_SHEET_NAME, COLUMN_NAME_MAP)
-    all_rows: list[ScheduleRow] = []
-    for loan in loans:
-        rows = build_schedule(
-            loan_number=loan["loan_number"],
-            periods_months=loan["periods_months"],
-            projected_close_date=loan["projected_close_date"],
-            interest_start_date=loan["interest_start_date"],
-            first_payment_date=loan["first_payment_date"],
-            cycle_day=loan["cycle_day"],
-            annual_rate_percent=loan["annual_rate_percent"],
-            loan_amount=loan["loan_amount"],
-            monthly_payment=loan["monthly_payment"],
-        )
-        all_rows.extend(rows)
+    schedules = build_schedules_parallel(loans)
 
-    display_schedule(all_rows)
-    export_schedule_excel(all_rows, OUTPUT_EXCEL_FILE)
+    if not args.no_display:
+        display_schedule(iter_schedule_rows(schedules))
+    export_schedule_excel(schedules, OUTPUT_EXCEL_FILE)
     print(f"Excel file saved to {OUTPUT_EXCEL_FILE}")
-    export_final_rows_excel(all_rows, OUTPUT_FINAL_ROWS_FILE)
+    export_final_rows_excel(iter_schedule_rows(schedules), OUTPUT_FINAL_ROWS_FILE)
     print(f"Excel file saved to {OUTPUT_FINAL_ROWS_FILE}")
 
 
@@ -2,18 +2,64 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime
-from decimal import Decimal, ROUND_HALF_UP, getcontext
-import calendar
+from typing import Iterator
+import errno
+import os
+import sys
 from zipfile import BadZipFile
 
+import numpy as np
+
+# Rates are carried as integer millionths of a percent so the daily interest
+# calculation can stay in integer cents with exact ROUND_HALF_UP rounding.
+# Rates with more than 6 decimal places are rejected rather than rounded.
+RATE_DECIMALS = 6
+RATE_SCALE = 10**RATE_DECIMALS
+DAILY_RATE_DENOMINATOR = 100 * 365 * RATE_SCALE
+DAILY_RATE_HALF = DAILY_RATE_DENOMINATOR // 2
+
+try:
+    # Optional ahead-of-time build of the kernel; see setup.py.
+    from _schedule import (
+        DAILY_RATE_DENOMINATOR_COMPILED as _COMPILED_DAILY_RATE_DENOMINATOR,
+        build_schedules_kernel as _compiled_schedules_kernel,
+    )
+except ImportError:
+    _compiled_schedules_kernel = None
+    _COMPILED_DAILY_RATE_DENOMINATOR = None
+
+# A build compiled against a different rate scale would round differently.
+if _COMPILED_DAILY_RATE_DENOMINATOR != DAILY_RATE_DENOMINATOR:
+    _compiled_schedules_kernel = None
+
+
+def _no_jit(*args: object, **kwargs: object):
+    def decorator(func):
+        return func
+
+    return decorator
 
-getcontext().prec = 28
+
+njit = _no_jit
+prange = range
+# The compiled kernel replaces the numba one, so numba's import and JIT
+# start-up are only paid for when it is missing. Without either, the kernels
+# run as plain Python, one loan at a time.
+if _compiled_schedules_kernel is None:
+    try:
+        from numba import njit, prange
+    except ModuleNotFoundError:
+        pass
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NAT_DAYS = np.datetime64("NaT", "D").astype(np.int64)
 
 INPUT_LOANS_FILE = "loans.xlsx"
 INPUT_SHEET_NAME = "Sheet1"
 OUTPUT_PARQUET_FILE = "amortization_schedule.parquet"
 OUTPUT_FINAL_ROWS_FILE = "amortization_final_rows.xlsx"
 OUTPUT_FINAL_ROWS_PARQUET_FILE = "amortization_final_rows.parquet"
+PARQUET_BATCH_ROWS = 131072
 COLUMN_NAME_MAP = {
     "loan_number": "loan_number",
     "periods_months": "periods_months",
@@ -25,201 +71,564 @@ COLUMN_NAME_MAP = {
     "loan_amount": "loan_amount",
     "monthly_payment": "monthly_payment",
 }
-
-
-@dataclass
-class ScheduleRow:
-    loan_number: str
-    period: int
-    payment_date: date | None
-    days: int | None
-    projected_close_date: date | None
-    beginning_balance: Decimal
-    daily_interest: Decimal | None
-    interest: Decimal | None
-    payment: Decimal | None
-    principal: Decimal | None
-    extra_interest: Decimal | None
-    ending_balance: Decimal
+FIRST_ROW_FIELDS = (
+    "payment_date",
+    "days",
+    "projected_close_date",
+    "beginning_balance",
+    "daily_interest",
+    "interest",
+    "payment",
+    "principal",
+    "extra_interest",
+    "ending_balance",
+)
+FINAL_ROW_FIELDS = (
+    "payment_date",
+    "days",
+    "beginning_balance",
+    "daily_interest",
+    "interest",
+    "payment",
+    "principal",
+    "extra_interest",
+    "ending_balance",
+)
+MONEY_FIELDS = frozenset(
+    (
+        "beginning_balance",
+        "daily_interest",
+        "interest",
+        "payment",
+        "principal",
+        "extra_interest",
+        "ending_balance",
+    )
+)
+FINAL_ROWS_PARQUET_COLUMNS = (
+    "loan_number",
+    "first_payment_date",
+    "first_payment_days",
+    "projected_close_date",
+    "first_begin_balance",
+    "first_daily_interest",
+    "first_interest",
+    "first_payment",
+    "first_principal",
+    "first_extra_interest",
+    "first_end_balance",
+    "final_payment_date",
+    "final_payment_days",
+    "final_begin_balance",
+    "final_daily_interest",
+    "final_interest",
+    "final_payment",
+    "final_principal",
+    "final_extra_interest",
+    "final_end_balance",
+    "total_interest_paid",
+)
+
+
+# Schedule rows for every loan as parallel arrays. Loan i owns rows
+# loan_offsets[i]:loan_offsets[i + 1], starting with its period 0 row; money
+# columns are int64 cents. Cells that are empty in the exports hold 0 or NaT;
+# see _missing_values.
+@dataclass(slots=True)
+class ScheduleColumns:
+    loan_numbers: list[str]
+    loan_offsets: np.ndarray
+    loan_index: np.ndarray
+    period: np.ndarray
+    payment_date: np.ndarray
+    days: np.ndarray
+    projected_close_date: np.ndarray
+    beginning_balance: np.ndarray
+    daily_interest: np.ndarray
+    interest: np.ndarray
+    payment: np.ndarray
+    principal: np.ndarray
+    extra_interest: np.ndarray
+    ending_balance: np.ndarray
+
+
+# One entry per distinct loan number, in first-seen order. first_rows and
+# final_rows index into ScheduleColumns; first_rows is -1 when no loan with
+# that number has a payment period.
+@dataclass(slots=True)
+class LoanSummaries:
+    loan_numbers: list[str]
+    first_rows: np.ndarray
+    final_rows: np.ndarray
+    total_interest: np.ndarray
 
 
 def parse_date(value: str) -> date:
+    # Accepts YYYY-MM-DD, MM/DD/YYYY and MM/DD/YY, picked by delimiter rather
+    # than by trying strptime formats. Two-digit years pivot like %y.
     value = value.strip()
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
-        try:
-            return datetime.strptime(value, fmt).date()
-        except ValueError:
-            continue
-    raise ValueError(f"Unsupported date format: {value}")
-
-
-def quantize_money(value: Decimal) -> Decimal:
-    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-
-def add_months(base_date: date, months: int, cycle_day: int) -> date:
-    month_index = base_date.month - 1 + months
-    year = base_date.year + month_index // 12
-    month = month_index % 12 + 1
-    last_day = calendar.monthrange(year, month)[1]
-    day = min(cycle_day, last_day)
-    return date(year, month, day)
-
-
-def build_schedule(
-    loan_number: str,
-    periods_months: int,
-    projected_close_date: date | None,
-    interest_start_date: date,
-    first_payment_date: date,
-    cycle_day: int,
-    annual_rate_percent: Decimal,
-    loan_amount: Decimal,
-    monthly_payment: Decimal,
-) -> list[ScheduleRow]:
-    rows: list[ScheduleRow] = []
-    balance = quantize_money(loan_amount)
-
-    # Calculate the actual interest start date:
-    # 1. Start with the same day as first_payment_date but one month prior
-    calculated_interest_start = add_months(first_payment_date, -1, first_payment_date.day)
-    
-    # 2. If projected_close_date is after the calculated date, use projected_close_date instead
-    if projected_close_date and projected_close_date > calculated_interest_start:
-        actual_interest_start_date = projected_close_date
+    parts = value.split("-")
+    if len(parts) == 3 and len(parts[0]) == 4:
+        year_text, month_text, day_text = parts
     else:
-        actual_interest_start_date = calculated_interest_start
-
-    rows.append(
-        ScheduleRow(
-            loan_number=loan_number,
-            period=0,
-            payment_date=actual_interest_start_date,
-            days=None,
-            projected_close_date=projected_close_date,
-            beginning_balance=balance,
-            daily_interest=None,
-            interest=None,
-            payment=None,
-            principal=None,
-            extra_interest=None,
-            ending_balance=balance,
+        parts = value.split("/")
+        if len(parts) != 3 or len(parts[2]) not in (2, 4):
+            raise ValueError(f"Unsupported date format: {value}")
+        month_text, day_text, year_text = parts
+    if not (
+        year_text.isdigit()
+        and month_text.isdigit()
+        and day_text.isdigit()
+        and len(month_text) <= 2
+        and len(day_text) <= 2
+    ):
+        raise ValueError(f"Unsupported date format: {value}")
+
+    year = int(year_text)
+    if len(year_text) == 2:
+        year += 1900 if year >= 69 else 2000
+    try:
+        return date(year, int(month_text), int(day_text))
+    except ValueError:
+        raise ValueError(f"Unsupported date format: {value}") from None
+
+
+def to_scaled_int(value: object, decimals: int, strict: bool = False) -> int:
+    # value * 10**decimals rounded ROUND_HALF_UP, computed exactly from the
+    # number's decimal text. Floats use repr, the shortest text that
+    # round-trips, so they round as the cell displays rather than as binary.
+    # With strict, a value that would need rounding raises ValueError instead.
+    if isinstance(value, int):
+        return value * 10**decimals
+    text = repr(value) if isinstance(value, float) else str(value).strip()
+    mantissa, marker, exponent = text.lower().partition("e")
+    sign = -1 if mantissa.startswith("-") else 1
+    if mantissa.startswith(("+", "-")):
+        mantissa = mantissa[1:]
+    whole, _, fraction = mantissa.partition(".")
+    if not (whole + fraction).isdigit():
+        raise ValueError(f"Unsupported number format: {value}")
+    digits = int(whole + fraction)
+    shift = decimals - len(fraction) + (int(exponent) if marker else 0)
+    if shift >= 0:
+        return sign * digits * 10**shift
+    divisor = 10**-shift
+    if strict and digits % divisor:
+        raise ValueError(
+            f"Unsupported number precision: {value} (at most {decimals} decimal places)"
         )
-    )
+    return sign * ((digits + divisor // 2) // divisor)
+
+
+def to_cents(value: object) -> int:
+    return to_scaled_int(value, 2)
+
+
+def to_rate_scaled(annual_rate_percent: object) -> int:
+    return to_scaled_int(annual_rate_percent, RATE_DECIMALS, strict=True)
+
+
+def add_months(base_dates: np.ndarray, months: np.ndarray, cycle_days: np.ndarray) -> np.ndarray:
+    # Elementwise over datetime64[D] dates: move each date by its month count
+    # and land on its cycle day, clamped to the length of the target month.
+    if np.any(cycle_days < 1):
+        raise ValueError("day is out of range for month")
+    target_months = (base_dates.astype("datetime64[M]") + months).astype(np.int64)
+    if target_months.size == 0:
+        return np.empty(0, dtype="datetime64[D]")
+    # Month starts and lengths are looked up from a table covering just the
+    # months spanned, instead of being derived again for every date.
+    first_month = target_months.min()
+    month_range = np.arange(first_month, target_months.max() + 2).astype("datetime64[M]")
+    month_starts = month_range.astype("datetime64[D]")
+    month_lengths = np.diff(month_starts).astype(np.int64)
+    month_index = target_months - first_month
+    return month_starts[month_index] + (np.minimum(cycle_days, month_lengths[month_index]) - 1)
+
+
+@njit(cache=True)
+def _build_schedule_kernel(
+    loan_amount: int,
+    monthly_payment: int,
+    annual_rate_scaled: int,
+    extra_days: int,
+    day_counts: np.ndarray,
+    beginning_balances: np.ndarray,
+    daily_interests: np.ndarray,
+    interests: np.ndarray,
+    payments: np.ndarray,
+    principals: np.ndarray,
+    extra_interests: np.ndarray,
+    ending_balances: np.ndarray,
+) -> None:
+    # The arrays are one loan's slices of the ScheduleColumns arrays: row 0
+    # is its period 0 row and row n is period n.
+    periods = day_counts.shape[0] - 1
+    balance = loan_amount
+    daily_interest = (annual_rate_scaled * balance + DAILY_RATE_HALF) // DAILY_RATE_DENOMINATOR
+    # The extra days before the interest start accrue at period 1's daily
+    # interest, so they are charged as extra days of period 1.
+    extra_interest = daily_interest * extra_days
+    beginning_balances[0] = balance
+    extra_interests[0] = extra_interest
+    ending_balances[0] = balance
+
+    for index in range(1, periods + 1):
+        days = day_counts[index]
+        payment = monthly_payment
+        if index == 1:
+            days += extra_days
+            payment += extra_interest
+        else:
+            daily_interest = (
+                annual_rate_scaled * balance + DAILY_RATE_HALF
+            ) // DAILY_RATE_DENOMINATOR
+        interest = daily_interest * days
+        payoff = balance + interest
+        if index == periods or payment > payoff:
+            payment = payoff
 
-    extra_interest: Decimal | None = None
-    if projected_close_date:
-        extra_days = (actual_interest_start_date - projected_close_date).days
-        if extra_days < 0:
-            extra_days = 0
-        extra_daily_interest = quantize_money(
-            (annual_rate_percent / Decimal(100)) * balance / Decimal(365)
-        )
-        extra_interest = quantize_money(extra_daily_interest * Decimal(extra_days))
-        rows[0].extra_interest = extra_interest
+        principal = payment - interest
+        ending_balance = balance - principal
+        if ending_balance < 0:
+            ending_balance = 0
+
+        beginning_balances[index] = balance
+        daily_interests[index] = daily_interest
+        interests[index] = interest
+        payments[index] = payment
+        principals[index] = principal
+        ending_balances[index] = ending_balance
+        balance = ending_balance
 
-    previous_date = actual_interest_start_date
-    for period in range(1, periods_months + 1):
-        if period == 1:
-            payment_date = first_payment_date
-        else:
-            payment_date = add_months(first_payment_date, period - 1, cycle_day)
 
-        days = (payment_date - previous_date).days
-        daily_interest = quantize_money(
-            (annual_rate_percent / Decimal(100)) * balance / Decimal(365)
+@njit(parallel=True, cache=True)
+def _build_schedules_kernel(
+    loan_offsets: np.ndarray,
+    loan_amounts: np.ndarray,
+    monthly_payments: np.ndarray,
+    annual_rates_scaled: np.ndarray,
+    extra_days: np.ndarray,
+    days: np.ndarray,
+    beginning_balances: np.ndarray,
+    daily_interests: np.ndarray,
+    interests: np.ndarray,
+    payments: np.ndarray,
+    principals: np.ndarray,
+    extra_interests: np.ndarray,
+    ending_balances: np.ndarray,
+) -> None:
+    # Loans write disjoint row ranges, so they can be built on separate threads.
+    for loan in prange(loan_amounts.shape[0]):
+        start = loan_offsets[loan]
+        end = loan_offsets[loan + 1]
+        _build_schedule_kernel(
+            loan_amounts[loan],
+            monthly_payments[loan],
+            annual_rates_scaled[loan],
+            extra_days[loan],
+            days[start:end],
+            beginning_balances[start:end],
+            daily_interests[start:end],
+            interests[start:end],
+            payments[start:end],
+            principals[start:end],
+            extra_interests[start:end],
+            ending_balances[start:end],
         )
-        interest = quantize_money(daily_interest * Decimal(days))
-        if period == 1 and extra_interest is not None:
-            interest = quantize_money(interest + extra_interest)
 
-        payment = monthly_payment
-        if period == 1 and extra_interest is not None:
-            payment = payment + extra_interest
-        if period == periods_months:
-            payment = balance + interest
-        elif payment > balance + interest:
-            payment = balance + interest
 
-        principal = payment - interest
-        ending_balance = quantize_money(balance - principal)
-        if ending_balance < Decimal("0.00"):
-            ending_balance = Decimal("0.00")
-
-        rows.append(
-            ScheduleRow(
-                loan_number=loan_number,
-                period=period,
-                payment_date=payment_date,
-                days=days,
-                projected_close_date=None,
-                beginning_balance=balance,
-                daily_interest=daily_interest,
-                interest=interest,
-                payment=payment,
-                principal=principal,
-                extra_interest=None,
-                ending_balance=ending_balance,
-            )
+def build_schedules(loans: list[dict[str, object]]) -> ScheduleColumns:
+    loan_count = len(loans)
+
+    # Fills an exactly sized array in one pass, with no intermediate list.
+    def loan_column(key: str, dtype: object) -> np.ndarray:
+        return np.fromiter((loan[key] for loan in loans), dtype=dtype, count=loan_count)
+
+    # Dates go through their integer ordinals, which numpy takes as plain
+    # int64 days since the epoch instead of converting date objects.
+    def loan_date_column(key: str) -> np.ndarray:
+        days = np.fromiter(
+            (
+                _NAT_DAYS if loan[key] is None else loan[key].toordinal() - _EPOCH_ORDINAL
+                for loan in loans
+            ),
+            dtype=np.int64,
+            count=loan_count,
         )
+        return days.view("datetime64[D]")
+
+    # A negative term gets just its period 0 row, like a zero one.
+    periods_months = np.maximum(loan_column("periods_months", np.int64), 0)
+    loan_offsets = np.zeros(loan_count + 1, dtype=np.int64)
+    np.cumsum(periods_months + 1, out=loan_offsets[1:])
+    opening_rows = loan_offsets[:-1]
+    row_count = int(loan_offsets[-1])
+    loan_index = np.repeat(np.arange(loan_count, dtype=np.int32), periods_months + 1)
+    period = (np.arange(row_count) - loan_offsets[loan_index]).astype(np.int32)
+
+    projected_close_dates = loan_date_column("projected_close_date")
+    first_payment_dates = loan_date_column("first_payment_date")
+    first_payment_days = (
+        first_payment_dates - first_payment_dates.astype("datetime64[M]")
+    ).astype(np.int64) + 1
+    cycle_days = loan_column("cycle_day", np.int64)
+    loan_amounts = loan_column("loan_amount", np.int64)
+    annual_rates_scaled = loan_column("annual_rate_percent", np.int64)
+
+    # Period n is paid n - 1 months after first_payment_date. Periods 0 and 1
+    # keep first_payment_date's own day, which puts period 0 on the calculated
+    # interest start date one month before the first payment.
+    payment_date = add_months(
+        first_payment_dates[loan_index],
+        period - 1,
+        np.where(period <= 1, first_payment_days[loan_index], cycle_days[loan_index]),
+    )
 
-        balance = ending_balance
-        previous_date = payment_date
+    # If projected_close_date is after the calculated date, use projected_close_date instead
+    actual_interest_start_dates = np.where(
+        projected_close_dates > payment_date[opening_rows],
+        projected_close_dates,
+        payment_date[opening_rows],
+    )
+    payment_date[opening_rows] = actual_interest_start_dates
 
-    return rows
+    days = np.zeros(row_count, dtype=np.int64)
+    days[1:] = np.diff(payment_date).astype(np.int64)
+    days[opening_rows] = 0
+
+    extra_days = np.where(
+        np.isnat(projected_close_dates),
+        0,
+        np.maximum((actual_interest_start_dates - projected_close_dates).astype(np.int64), 0),
+    )
+
+    schedules = ScheduleColumns(
+        loan_numbers=[loan["loan_number"] for loan in loans],
+        loan_offsets=loan_offsets,
+        loan_index=loan_index,
+        period=period,
+        payment_date=payment_date,
+        days=days,
+        projected_close_date=np.full(row_count, np.datetime64("NaT"), dtype="datetime64[D]"),
+        beginning_balance=np.zeros(row_count, dtype=np.int64),
+        daily_interest=np.zeros(row_count, dtype=np.int64),
+        interest=np.zeros(row_count, dtype=np.int64),
+        payment=np.zeros(row_count, dtype=np.int64),
+        principal=np.zeros(row_count, dtype=np.int64),
+        extra_interest=np.zeros(row_count, dtype=np.int64),
+        ending_balance=np.zeros(row_count, dtype=np.int64),
+    )
+    schedules.projected_close_date[opening_rows] = projected_close_dates
+
+    kernel = _compiled_schedules_kernel or _build_schedules_kernel
+    kernel(
+        loan_offsets,
+        loan_amounts,
+        loan_column("monthly_payment", np.int64),
+        annual_rates_scaled,
+        extra_days,
+        days,
+        schedules.beginning_balance,
+        schedules.daily_interest,
+        schedules.interest,
+        schedules.payment,
+        schedules.principal,
+        schedules.extra_interest,
+        schedules.ending_balance,
+    )
+
+    return schedules
+
+
+def _missing_values(schedules: ScheduleColumns) -> dict[str, np.ndarray]:
+    opening = schedules.period == 0
+    return {
+        "days": opening,
+        "projected_close_date": np.isnat(schedules.projected_close_date),
+        "daily_interest": opening,
+        "interest": opening,
+        "payment": opening,
+        "principal": opening,
+        "extra_interest": ~opening | np.isnat(schedules.projected_close_date),
+    }
 
 
-def export_schedule_parquet(rows: list[ScheduleRow], file_path: str) -> None:
+def export_schedule_parquet(schedules: ScheduleColumns, file_path: str) -> None:
     try:
-        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
-            "pandas is required to export Parquet files. Install with: pip install pandas pyarrow"
+            "pyarrow is required to export Parquet files. Install with: pip install pyarrow"
         ) from exc
 
-    data = []
-    for row in rows:
-        item = {
-            "loan_number": row.loan_number,
-            "period": row.period,
-            "payment_date": row.payment_date,
-            "days": row.days,
-            "projected_close_date": row.projected_close_date,
-            "beginning_balance": float(row.beginning_balance) if row.beginning_balance is not None else None,
-            "daily_interest": float(row.daily_interest) if row.daily_interest is not None else None,
-            "interest": float(row.interest) if row.interest is not None else None,
-            "payment": float(row.payment) if row.payment is not None else None,
-            "principal": float(row.principal) if row.principal is not None else None,
-            "extra_interest": float(row.extra_interest) if row.extra_interest is not None else None,
-            "ending_balance": float(row.ending_balance) if row.ending_balance is not None else None,
-        }
-        data.append(item)
-
-    df = pd.DataFrame(data)
-    df.to_parquet(file_path)
-
+    schema = pa.schema(
+        [
+            ("loan_number", pa.string()),
+            ("period", pa.int32()),
+            ("payment_date", pa.date32()),
+            ("days", pa.int32()),
+            ("projected_close_date", pa.date32()),
+            ("beginning_balance", pa.float64()),
+            ("daily_interest", pa.float64()),
+            ("interest", pa.float64()),
+            ("payment", pa.float64()),
+            ("principal", pa.float64()),
+            ("extra_interest", pa.float64()),
+            ("ending_balance", pa.float64()),
+        ]
+    )
+    loan_numbers = pa.array(schedules.loan_numbers, type=pa.string())
+    missing = _missing_values(schedules)
+
+    # Each batch becomes its own row group, so only one batch of Arrow
+    # buffers exists at a time. Dictionary pages collapse the loan numbers
+    # and dates that repeat across a loan's rows.
+    with pq.ParquetWriter(
+        file_path,
+        schema,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+    ) as writer:
+        for start in range(0, len(schedules.period), PARQUET_BATCH_ROWS):
+            rows = slice(start, start + PARQUET_BATCH_ROWS)
+            arrays = [loan_numbers.take(schedules.loan_index[rows])]
+            for field in list(schema)[1:]:
+                values = getattr(schedules, field.name)[rows]
+                if field.name in MONEY_FIELDS:
+                    values = values / 100
+                mask = missing[field.name][rows] if field.name in missing else None
+                arrays.append(pa.array(values, type=field.type, mask=mask))
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+
+def summarize_loans(schedules: ScheduleColumns) -> LoanSummaries:
+    # Loans that share a loan number are reported together: the first
+    # payment row of the earliest, the final row of the last, and the
+    # interest of all of them.
+    group_by_number: dict[str, int] = {}
+    groups = np.array(
+        [group_by_number.setdefault(number, len(group_by_number)) for number in schedules.loan_numbers],
+        dtype=np.int64,
+    )
+    group_count = len(group_by_number)
+    opening_rows = schedules.loan_offsets[:-1]
+    final_rows = schedules.loan_offsets[1:] - 1
+
+    # Rows grow with loan order, so the earliest loan of a group has the
+    # smallest rows and the last one the largest.
+    no_row = np.iinfo(np.int64).max
+    first_rows = np.full(group_count, no_row, dtype=np.int64)
+    has_payments = final_rows > opening_rows
+    np.minimum.at(first_rows, groups[has_payments], (opening_rows + 1)[has_payments])
+    first_rows[first_rows == no_row] = -1
+
+    group_final_rows = np.full(group_count, -1, dtype=np.int64)
+    np.maximum.at(group_final_rows, groups, final_rows)
+
+    total_interest = np.zeros(group_count, dtype=np.int64)
+    np.add.at(total_interest, groups, np.add.reduceat(schedules.interest, opening_rows))
+
+    return LoanSummaries(list(group_by_number), first_rows, group_final_rows, total_interest)
+
+
+def final_row_columns(
+    schedules: ScheduleColumns, summaries: LoanSummaries
+) -> list[np.ma.MaskedArray]:
+    # Columns of the final-rows report, in report order; masked cells are
+    # written as empty.
+    missing = _missing_values(schedules)
+    columns = [np.ma.masked_array(np.array(summaries.loan_numbers, dtype=object))]
+    for rows, names in (
+        (summaries.first_rows, FIRST_ROW_FIELDS),
+        (summaries.final_rows, FINAL_ROW_FIELDS),
+    ):
+        absent = rows < 0
+        for name in names:
+            values = getattr(schedules, name)[rows]
+            if name in MONEY_FIELDS:
+                values = values / 100
+            mask = absent | missing[name][rows] if name in missing else absent
+            columns.append(np.ma.masked_array(values, mask))
+    columns.append(np.ma.masked_array(summaries.total_interest / 100))
+    return columns
+
+
+def as_text(value: object) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        # calamine reports every numeric cell as a float.
+        return str(int(value))
+    return str(value).strip()
+
+
+def to_int(value: object) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return int(as_text(value))
+
+
+def to_date(value: object) -> date:
+    # Date-formatted cells already arrive as date/datetime; only text cells
+    # need parsing.
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return parse_date(str(value))
+
+
+def _read_sheet_rows(file_path: str, sheet_name: str) -> Iterator[tuple[object, ...]]:
+    try:
+        from python_calamine import CalamineError, CalamineWorkbook, WorksheetNotFound
+    except ModuleNotFoundError:
+        CalamineWorkbook = None
+
+    if CalamineWorkbook is not None:
+        # Raise the same errors as the openpyxl path below: calamine reports a
+        # missing file as a bare OSError and a missing sheet as its own error.
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), file_path)
+        try:
+            workbook = CalamineWorkbook.from_path(file_path)
+        except CalamineError as exc:
+            raise ValueError("Input file is not a valid Excel workbook.") from exc
+        try:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+        except WorksheetNotFound as exc:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.") from exc
+        return iter(sheet.to_python(skip_empty_area=False))
 
-def load_loans(
-    file_path: str, sheet_name: str, column_map: dict[str, str]
-) -> list[dict[str, object]]:
     try:
         from openpyxl import load_workbook
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
-            "openpyxl is required to read Excel files. Install with: pip install openpyxl"
+            "python-calamine or openpyxl is required to read Excel files. "
+            "Install with: pip install python-calamine"
         ) from exc
 
-    lower_path = file_path.lower()
-    if not (lower_path.endswith(".xlsx") or lower_path.endswith(".xlsm")):
-        raise ValueError("Input file must be an .xlsx or .xlsm Excel file.")
-
     try:
         workbook = load_workbook(file_path, read_only=True, data_only=True)
     except BadZipFile as exc:
         raise ValueError("Input file is not a valid Excel workbook.") from exc
+    return workbook[sheet_name].iter_rows(values_only=True)
+
+
+def load_loans(
+    file_path: str, sheet_name: str, column_map: dict[str, str]
+) -> list[dict[str, object]]:
+    lower_path = file_path.lower()
+    if not (lower_path.endswith(".xlsx") or lower_path.endswith(".xlsm")):
+        raise ValueError("Input file must be an .xlsx or .xlsm Excel file.")
 
-    sheet = workbook[sheet_name]
-    rows_iter = sheet.iter_rows(values_only=True)
+    rows_iter = _read_sheet_rows(file_path, sheet_name)
     header_row = next(rows_iter, None)
     if header_row is None:
         return []
@@ -234,34 +643,19 @@ def load_loans(
 
     loans: list[dict[str, object]] = []
     for row_values in rows_iter:
-        def as_text(value: object) -> str:
-            if isinstance(value, datetime):
-                return value.date().isoformat()
-            if isinstance(value, date):
-                return value.isoformat()
-            return str(value).strip()
-
         loans.append(
             {
-                "loan_number": as_text(cell_value(row_values, "loan_number")),
-                "periods_months": int(as_text(cell_value(row_values, "periods_months"))),
-                "projected_close_date": parse_date(
-                    as_text(cell_value(row_values, "projected_close_date"))
-                ),
-                "interest_start_date": parse_date(
-                    as_text(cell_value(row_values, "interest_start_date"))
-                ),
-                "first_payment_date": parse_date(
-                    as_text(cell_value(row_values, "first_payment_date"))
-                ),
-                "cycle_day": int(as_text(cell_value(row_values, "cycle_day"))),
-                "annual_rate_percent": Decimal(
-                    as_text(cell_value(row_values, "annual_rate_percent"))
-                ),
-                "loan_amount": Decimal(as_text(cell_value(row_values, "loan_amount"))),
-                "monthly_payment": Decimal(
-                    as_text(cell_value(row_values, "monthly_payment"))
+                "loan_number": sys.intern(as_text(cell_value(row_values, "loan_number"))),
+                "periods_months": to_int(cell_value(row_values, "periods_months")),
+                "projected_close_date": to_date(cell_value(row_values, "projected_close_date")),
+                "interest_start_date": to_date(cell_value(row_values, "interest_start_date")),
+                "first_payment_date": to_date(cell_value(row_values, "first_payment_date")),
+                "cycle_day": to_int(cell_value(row_values, "cycle_day")),
+                "annual_rate_percent": to_rate_scaled(
+                    cell_value(row_values, "annual_rate_percent")
                 ),
+                "loan_amount": to_cents(cell_value(row_values, "loan_amount")),
+                "monthly_payment": to_cents(cell_value(row_values, "monthly_payment")),
             }
         )
     return loans
@@ -269,18 +663,34 @@ def load_loans(
 
 
 
-def export_final_rows_excel(rows: list[ScheduleRow], file_path: str) -> None:
+def export_final_rows_excel(columns: list[np.ma.MaskedArray], file_path: str) -> None:
     try:
-        from openpyxl import Workbook
-        from openpyxl.styles import numbers
+        import xlsxwriter
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
-            "openpyxl is required to export Excel files. Install with: pip install openpyxl"
+            "xlsxwriter is required to export Excel files. Install with: pip install xlsxwriter"
         ) from exc
 
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Final Rows"
+    # constant_memory flushes each row to disk once the next row starts and
+    # writes strings inline rather than through a shared-strings table.
+    # Formats are set once per column instead of per cell.
+    workbook = xlsxwriter.Workbook(
+        file_path,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd",
+            "strings_to_urls": False,
+        },
+    )
+    sheet = workbook.add_worksheet("Final Rows")
+    sheet.set_column("A:A", None, workbook.add_format({"num_format": "@"}))
+    dates = workbook.add_format({"num_format": "yyyy-mm-dd"})
+    sheet.set_column("B:B", None, dates)
+    sheet.set_column("D:D", None, dates)
+    sheet.set_column("L:L", None, dates)
+    money = workbook.add_format({"num_format": "0.00"})
+    sheet.set_column("E:K", None, money)
+    sheet.set_column("N:U", None, money)
 
     headers = [
         "Loan #",
@@ -305,181 +715,57 @@ def export_final_rows_excel(rows: list[ScheduleRow], file_path: str) -> None:
         "Final End Balance",
         "Total Interest Paid",
     ]
-    sheet.append(headers)
-
-    first_payment_by_loan: dict[str, ScheduleRow] = {}
-    final_by_loan: dict[str, ScheduleRow] = {}
-    total_interest_by_loan: dict[str, Decimal] = {}
-    
-    for row in rows:
-        final_by_loan[row.loan_number] = row
-        if row.period == 1 and row.loan_number not in first_payment_by_loan:
-            first_payment_by_loan[row.loan_number] = row
-        
-        # Calculate total interest paid (sum interest from all payment periods, excluding period 0)
-        if row.period > 0 and row.interest is not None:
-            if row.loan_number not in total_interest_by_loan:
-                total_interest_by_loan[row.loan_number] = Decimal("0.00")
-            total_interest_by_loan[row.loan_number] += row.interest
-
-    def to_float(value: Decimal | None) -> float | None:
-        if value is None:
-            return None
-        return float(value)
-
-    for loan_number, final_row in final_by_loan.items():
-        first_row = first_payment_by_loan.get(loan_number)
-        total_interest = total_interest_by_loan.get(loan_number, Decimal("0.00"))
-        sheet.append(
-            [
-                loan_number,
-                first_row.payment_date if first_row else None,
-                first_row.days if first_row else None,
-                first_row.projected_close_date if first_row else None,
-                to_float(first_row.beginning_balance) if first_row else None,
-                to_float(first_row.daily_interest) if first_row else None,
-                to_float(first_row.interest) if first_row else None,
-                to_float(first_row.payment) if first_row else None,
-                to_float(first_row.principal) if first_row else None,
-                to_float(first_row.extra_interest) if first_row else None,
-                to_float(first_row.ending_balance) if first_row else None,
-                final_row.payment_date if final_row else None,
-                final_row.days if final_row else None,
-                to_float(final_row.beginning_balance) if final_row else None,
-                to_float(final_row.daily_interest) if final_row else None,
-                to_float(final_row.interest) if final_row else None,
-                to_float(final_row.payment) if final_row else None,
-                to_float(final_row.principal) if final_row else None,
-                to_float(final_row.extra_interest) if final_row else None,
-                to_float(final_row.ending_balance) if final_row else None,
-                to_float(total_interest),
-            ]
-        )
-
-    for cell in sheet["A"][1:]:
-        cell.number_format = numbers.FORMAT_TEXT
-
-    for cell in sheet["B"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
-
-    for cell in sheet["D"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
-
-    for cell in sheet["L"][1:]:
-        cell.number_format = numbers.FORMAT_DATE_YYYYMMDD2
+    sheet.write_row(0, 0, headers, workbook.add_format())
 
-    for column in ["E", "F", "G", "H", "I", "J", "K", "N", "O", "P", "Q", "R", "S", "T", "U"]:
-        for cell in sheet[column][1:]:
-            cell.number_format = numbers.FORMAT_NUMBER_00
+    for row_index, values in enumerate(zip(*(column.tolist() for column in columns)), start=1):
+        sheet.write_row(row_index, 0, values)
 
-    workbook.save(file_path)
+    workbook.close()
 
 
-def export_final_rows_parquet(rows: list[ScheduleRow], file_path: str) -> None:
+def export_final_rows_parquet(columns: list[np.ma.MaskedArray], file_path: str) -> None:
     try:
-        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
-            "pandas is required to export Parquet files. Install with: pip install pandas pyarrow"
+            "pyarrow is required to export Parquet files. Install with: pip install pyarrow"
         ) from exc
 
-    first_payment_by_loan: dict[str, ScheduleRow] = {}
-    final_by_loan: dict[str, ScheduleRow] = {}
-    total_interest_by_loan: dict[str, Decimal] = {}
-    
-    for row in rows:
-        final_by_loan[row.loan_number] = row
-        if row.period == 1 and row.loan_number not in first_payment_by_loan:
-            first_payment_by_loan[row.loan_number] = row
-        
-        # Calculate total interest paid (sum interest from all payment periods, excluding period 0)
-        if row.period > 0 and row.interest is not None:
-            if row.loan_number not in total_interest_by_loan:
-                total_interest_by_loan[row.loan_number] = Decimal("0.00")
-            total_interest_by_loan[row.loan_number] += row.interest
-
-    def to_float(value: Decimal | None) -> float | None:
-        if value is None:
-            return None
-        return float(value)
-
-    data = {
-        "loan_number": [],
-        "first_payment_date": [],
-        "first_payment_days": [],
-        "projected_close_date": [],
-        "first_begin_balance": [],
-        "first_daily_interest": [],
-        "first_interest": [],
-        "first_payment": [],
-        "first_principal": [],
-        "first_extra_interest": [],
-        "first_end_balance": [],
-        "final_payment_date": [],
-        "final_payment_days": [],
-        "final_begin_balance": [],
-        "final_daily_interest": [],
-        "final_interest": [],
-        "final_payment": [],
-        "final_principal": [],
-        "final_extra_interest": [],
-        "final_end_balance": [],
-        "total_interest_paid": [],
+    # Dates and money keep the types numpy gives them (date32, double).
+    types = {
+        "loan_number": pa.string(),
+        "first_payment_days": pa.int32(),
+        "final_payment_days": pa.int32(),
     }
-
-    for loan_number, final_row in final_by_loan.items():
-        first_row = first_payment_by_loan.get(loan_number)
-        total_interest = total_interest_by_loan.get(loan_number, Decimal("0.00"))
-        
-        data["loan_number"].append(loan_number)
-        data["first_payment_date"].append(first_row.payment_date if first_row else None)
-        data["first_payment_days"].append(first_row.days if first_row else None)
-        data["projected_close_date"].append(first_row.projected_close_date if first_row else None)
-        data["first_begin_balance"].append(to_float(first_row.beginning_balance) if first_row else None)
-        data["first_daily_interest"].append(to_float(first_row.daily_interest) if first_row else None)
-        data["first_interest"].append(to_float(first_row.interest) if first_row else None)
-        data["first_payment"].append(to_float(first_row.payment) if first_row else None)
-        data["first_principal"].append(to_float(first_row.principal) if first_row else None)
-        data["first_extra_interest"].append(to_float(first_row.extra_interest) if first_row else None)
-        data["first_end_balance"].append(to_float(first_row.ending_balance) if first_row else None)
-        data["final_payment_date"].append(final_row.payment_date if final_row else None)
-        data["final_payment_days"].append(final_row.days if final_row else None)
-        data["final_begin_balance"].append(to_float(final_row.beginning_balance) if final_row else None)
-        data["final_daily_interest"].append(to_float(final_row.daily_interest) if final_row else None)
-        data["final_interest"].append(to_float(final_row.interest) if final_row else None)
-        data["final_payment"].append(to_float(final_row.payment) if final_row else None)
-        data["final_principal"].append(to_float(final_row.principal) if final_row else None)
-        data["final_extra_interest"].append(to_float(final_row.extra_interest) if final_row else None)
-        data["final_end_balance"].append(to_float(final_row.ending_balance) if final_row else None)
-        data["total_interest_paid"].append(to_float(total_interest))
-
-    df = pd.DataFrame(data)
-    df.to_parquet(file_path, index=False)
+    table = pa.Table.from_arrays(
+        [
+            pa.array(column.data, mask=np.ma.getmaskarray(column), type=types.get(name))
+            for name, column in zip(FINAL_ROWS_PARQUET_COLUMNS, columns)
+        ],
+        names=list(FINAL_ROWS_PARQUET_COLUMNS),
+    )
+    pq.write_table(
+        table,
+        file_path,
+        row_group_size=PARQUET_BATCH_ROWS,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+    )
 
 
 def main() -> None:
     loans = load_loans(INPUT_LOANS_FILE, INPUT_SHEET_NAME, COLUMN_NAME_MAP)
-    all_rows: list[ScheduleRow] = []
-    for loan in loans:
-        rows = build_schedule(
-            loan_number=loan["loan_number"],
-            periods_months=loan["periods_months"],
-            projected_close_date=loan["projected_close_date"],
-            interest_start_date=loan["interest_start_date"],
-            first_payment_date=loan["first_payment_date"],
-            cycle_day=loan["cycle_day"],
-            annual_rate_percent=loan["annual_rate_percent"],
-            loan_amount=loan["loan_amount"],
-            monthly_payment=loan["monthly_payment"],
-        )
-        all_rows.extend(rows)
+    schedules = build_schedules(loans)
 
-    print(f"Processing {len(loans)} loans with {len(all_rows)} total rows...")
-    export_schedule_parquet(all_rows, OUTPUT_PARQUET_FILE)
+    print(f"Processing {len(loans)} loans with {len(schedules.period)} total rows...")
+    export_schedule_parquet(schedules, OUTPUT_PARQUET_FILE)
     print(f"Parquet file saved to {OUTPUT_PARQUET_FILE}")
-    export_final_rows_excel(all_rows, OUTPUT_FINAL_ROWS_FILE)
+    final_rows = final_row_columns(schedules, summarize_loans(schedules))
+    export_final_rows_excel(final_rows, OUTPUT_FINAL_ROWS_FILE)
     print(f"Excel file saved to {OUTPUT_FINAL_ROWS_FILE}")
-    export_final_rows_parquet(all_rows, OUTPUT_FINAL_ROWS_PARQUET_FILE)
+    export_final_rows_parquet(final_rows, OUTPUT_FINAL_ROWS_PARQUET_FILE)
     print(f"Parquet file saved to {OUTPUT_FINAL_ROWS_PARQUET_FILE}")
 
 
@@ -0,0 +1,13 @@
+# Builds the optional compiled amortization kernels used by app.py and
+# app_par_actual.py:
+#
+#     python setup.py build_ext --inplace
+#
+# The scripts run without it, falling back to numba or plain NumPy.
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="interest_rate",
+    ext_modules=cythonize("_schedule.pyx", language_level=3),
+)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# app.py and app_par_actual.py are standalone scripts at the repository root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+import app
+import app_par_actual
+
+try:
+    import _schedule
+except ImportError:
+    _schedule = None
+
+requires_compiled = pytest.mark.skipif(_schedule is None, reason="_schedule is not built")
+
+
+def python_function(func):
+    # The undecorated function when numba has compiled it.
+    return getattr(func, "py_func", func)
+
+
+def random_portfolio(loan_count: int = 400, seed: int = 20240131) -> dict[str, object]:
+    # Includes zero-period loans, zero and negative day counts, zero rates and
+    # payments too small to cover interest.
+    rng = np.random.default_rng(seed)
+    periods_months = rng.choice([0, 0, 1, 2, 3, 12, 61, 360], loan_count).astype(np.int64)
+    return {
+        "periods_months": periods_months,
+        "loan_amounts": rng.integers(0, 10**9, loan_count, dtype=np.int64),
+        "monthly_payments": rng.integers(0, 5 * 10**6, loan_count, dtype=np.int64),
+        "annual_rates_scaled": rng.choice(
+            [0, 1, 3500000, 6875000, 12999999, 29999999], loan_count
+        ).astype(np.int64),
+        "extra_days": rng.integers(0, 90, loan_count, dtype=np.int64),
+        "period_days": [rng.integers(-31, 63, periods, dtype=np.int64) for periods in periods_months],
+    }
+
+
+def run_app_kernel(kernel, portfolio: dict[str, object]) -> list[np.ndarray]:
+    periods_months = portfolio["periods_months"]
+    day_counts = np.zeros((len(periods_months), periods_months.max()), dtype=np.int64)
+    for loan_index, days in enumerate(portfolio["period_days"]):
+        day_counts[loan_index, : len(days)] = days
+    extra_interests = portfolio["extra_days"] * 137
+    columns = kernel(
+        portfolio["loan_amounts"],
+        portfolio["monthly_payments"],
+        portfolio["annual_rates_scaled"],
+        extra_interests,
+        periods_months,
+        day_counts,
+    )
+    # Cells past a loan's term are padding and never read back.
+    in_term = np.arange(day_counts.shape[1]) < periods_months[:, None]
+    return [np.asarray(column)[in_term] for column in columns]
+
+
+def run_app_par_actual_kernel(kernel, portfolio: dict[str, object]) -> list[np.ndarray]:
+    periods_months = portfolio["periods_months"]
+    loan_offsets = np.zeros(len(periods_months) + 1, dtype=np.int64)
+    np.cumsum(periods_months + 1, out=loan_offsets[1:])
+    days = np.concatenate(
+        [np.concatenate(([0], loan_days)) for loan_days in portfolio["period_days"]]
+    ).astype(np.int64)
+    outputs = [np.zeros(int(loan_offsets[-1]), dtype=np.int64) for _ in range(7)]
+    kernel(
+        loan_offsets,
+        portfolio["loan_amounts"],
+        portfolio["monthly_payments"],
+        portfolio["annual_rates_scaled"],
+        portfolio["extra_days"],
+        days,
+        *outputs,
+    )
+    return outputs
+
+
+def python_build_schedules_kernel(
+    loan_offsets, loan_amounts, monthly_payments, annual_rates_scaled, extra_days, days, *outputs
+):
+    # app_par_actual's per-loan step run as plain Python, one loan at a time.
+    build_schedule = python_function(app_par_actual._build_schedule_kernel)
+    for loan in range(len(loan_amounts)):
+        start, end = loan_offsets[loan], loan_offsets[loan + 1]
+        build_schedule(
+            int(loan_amounts[loan]),
+            int(monthly_payments[loan]),
+            int(annual_rates_scaled[loan]),
+            int(extra_days[loan]),
+            days[start:end],
+            *(output[start:end] for output in outputs),
+        )
+
+
+def assert_columns_equal(actual: list[np.ndarray], expected: list[np.ndarray]) -> None:
+    assert len(actual) == len(expected)
+    for actual_column, expected_column in zip(actual, expected):
+        np.testing.assert_array_equal(actual_column, expected_column)
+
+
+def test_app_kernel_matches_numpy():
+    portfolio = random_portfolio()
+    assert_columns_equal(
+        run_app_kernel(app._schedule_kernel, portfolio),
+        run_app_kernel(python_function(app._schedule_kernel), portfolio),
+    )
+
+
+def test_app_par_actual_kernel_matches_python():
+    portfolio = random_portfolio()
+    assert_columns_equal(
+        run_app_par_actual_kernel(app_par_actual._build_schedules_kernel, portfolio),
+        run_app_par_actual_kernel(python_build_schedules_kernel, portfolio),
+    )
+
+
+@requires_compiled
+def test_compiled_rate_denominator_matches():
+    assert _schedule.DAILY_RATE_DENOMINATOR_COMPILED == app.DAILY_RATE_DENOMINATOR
+    assert _schedule.DAILY_RATE_DENOMINATOR_COMPILED == app_par_actual.DAILY_RATE_DENOMINATOR
+
+
+@requires_compiled
+def test_compiled_app_kernel_matches_numpy():
+    portfolio = random_portfolio()
+    assert_columns_equal(
+        run_app_kernel(_schedule.schedule_kernel, portfolio),
+        run_app_kernel(python_function(app._schedule_kernel), portfolio),
+    )
+
+
+@requires_compiled
+def test_compiled_app_par_actual_kernel_matches_python():
+    portfolio = random_portfolio()
+    assert_columns_equal(
+        run_app_par_actual_kernel(_schedule.build_schedules_kernel, portfolio),
+        run_app_par_actual_kernel(python_build_schedules_kernel, portfolio),
+    )
@@ -0,0 +1,109 @@
+from datetime import date
+
+import pytest
+
+from app_par_actual import parse_date, to_cents, to_rate_scaled, to_scaled_int
+
+# Expected values are Decimal(text) * 10**decimals rounded ROUND_HALF_UP, with
+# floats taken from their repr.
+SCALED_INT_CASES = [
+    ("1.005", 2, 101),
+    ("1.004", 2, 100),
+    ("0.005", 2, 1),
+    ("0.015", 2, 2),
+    ("0.0049999", 2, 0),
+    ("-1.005", 2, -101),
+    ("-1.004", 2, -100),
+    ("-0.005", 2, -1),
+    ("-0", 2, 0),
+    ("+3.1", 2, 310),
+    ("  7.10 ", 2, 710),
+    ("1234567890123.455", 2, 123456789012346),
+    ("1e-05", 2, 0),
+    ("1E+3", 2, 100000),
+    ("1.5e2", 2, 15000),
+    ("5e-3", 2, 1),
+    (1.005, 2, 101),
+    (2.675, 2, 268),
+    (0.1, 2, 10),
+    (1e-05, 2, 0),
+    (1e22, 2, 10**24),
+    (12, 2, 1200),
+    (-7, 2, -700),
+    ("7.1234565", 6, 7123457),
+    ("7.123456", 6, 7123456),
+]
+
+REJECTED_NUMBERS = ["", "abc", ".", "1.2.3", "--1", "+-1", "1,000", "1e", "1e5.5", "0x10", "nan"]
+
+
+@pytest.mark.parametrize(("value", "decimals", "expected"), SCALED_INT_CASES)
+def test_to_scaled_int(value, decimals, expected):
+    assert to_scaled_int(value, decimals) == expected
+
+
+@pytest.mark.parametrize("value", REJECTED_NUMBERS + [float("nan"), float("inf")])
+def test_to_scaled_int_rejects_text(value):
+    with pytest.raises(ValueError):
+        to_scaled_int(value, 2)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("7.123456", 7123456), ("7.12345600", 7123456), ("1e-6", 1), (6.875, 6875000), (5, 5000000)],
+)
+def test_to_rate_scaled(value, expected):
+    assert to_rate_scaled(value) == expected
+
+
+@pytest.mark.parametrize("value", ["7.1234565", 7.1234567, "1e-7", "-0.0000001"])
+def test_to_rate_scaled_rejects_extra_decimals(value):
+    with pytest.raises(ValueError):
+        to_rate_scaled(value)
+
+
+def test_to_cents_rounds_half_up():
+    assert to_cents("2.345") == 235
+    assert to_cents(-2.345) == -235
+
+
+# Expected values match the strptime formats parse_date replaced:
+# %Y-%m-%d, %m/%d/%Y and %m/%d/%y, which pivots two-digit years at 69.
+PARSE_DATE_CASES = [
+    ("2024-01-31", date(2024, 1, 31)),
+    (" 2024-02-29 ", date(2024, 2, 29)),
+    ("2024-1-5", date(2024, 1, 5)),
+    ("01/31/2024", date(2024, 1, 31)),
+    ("1/5/2024", date(2024, 1, 5)),
+    ("2/29/24", date(2024, 2, 29)),
+    ("12/31/68", date(2068, 12, 31)),
+    ("01/01/69", date(1969, 1, 1)),
+    ("1/1/00", date(2000, 1, 1)),
+    ("12/31/99", date(1999, 12, 31)),
+]
+
+REJECTED_DATES = [
+    "",
+    "abc",
+    "2023-02-29",
+    "2024-01",
+    "2024-001-05",
+    "2024-01-31T00:00",
+    "2024/01/31",
+    "31-01-2024",
+    "13/01/2024",
+    "01/32/2024",
+    "1/1/123",
+    "+1/1/2024",
+]
+
+
+@pytest.mark.parametrize(("value", "expected"), PARSE_DATE_CASES)
+def test_parse_date(value, expected):
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize("value", REJECTED_DATES)
+def test_parse_date_rejects_text(value):
+    with pytest.raises(ValueError, match="Unsupported date format"):
+        parse_date(value)
@@ -0,0 +1,74 @@
+from datetime import date
+
+import app
+import app_par_actual
+
+# One loan with extra interest, a month-end cycle day through a leap February
+# and a payment large enough to pay off before the last period.
+LOAN = {
+    "loan_number": "L-1001",
+    "periods_months": 14,
+    "projected_close_date": date(2023, 12, 10),
+    "interest_start_date": date(2023, 12, 31),
+    "first_payment_date": date(2024, 1, 31),
+    "cycle_day": 31,
+    "annual_rate_percent": 6875000,
+    "loan_amount": 2500000,
+    "monthly_payment": 215000,
+}
+
+# Produced by the original Decimal build_schedule of app.py and of
+# app_par_actual.py, which agree on this loan. Money is in cents:
+# (period, payment_date, days, beginning_balance, daily_interest, interest,
+#  payment, principal, extra_interest, ending_balance)
+EXPECTED = [
+    (0, "2023-12-31", None, 2500000, None, None, None, None, 9891, 2500000),
+    (1, "2024-01-31", 31, 2500000, 471, 24492, 224891, 200399, None, 2299601),
+    (2, "2024-02-29", 29, 2299601, 433, 12557, 215000, 202443, None, 2097158),
+    (3, "2024-03-31", 31, 2097158, 395, 12245, 215000, 202755, None, 1894403),
+    (4, "2024-04-30", 30, 1894403, 357, 10710, 215000, 204290, None, 1690113),
+    (5, "2024-05-31", 31, 1690113, 318, 9858, 215000, 205142, None, 1484971),
+    (6, "2024-06-30", 30, 1484971, 280, 8400, 215000, 206600, None, 1278371),
+    (7, "2024-07-31", 31, 1278371, 241, 7471, 215000, 207529, None, 1070842),
+    (8, "2024-08-31", 31, 1070842, 202, 6262, 215000, 208738, None, 862104),
+    (9, "2024-09-30", 30, 862104, 162, 4860, 215000, 210140, None, 651964),
+    (10, "2024-10-31", 31, 651964, 123, 3813, 215000, 211187, None, 440777),
+    (11, "2024-11-30", 30, 440777, 83, 2490, 215000, 212510, None, 228267),
+    (12, "2024-12-31", 31, 228267, 43, 1333, 215000, 213667, None, 14600),
+    (13, "2025-01-31", 31, 14600, 3, 93, 14693, 14600, None, 0),
+    (14, "2025-02-28", 28, 0, 0, 0, 0, 0, None, 0),
+]
+
+FIELDS = (
+    "period",
+    "payment_date",
+    "days",
+    "beginning_balance",
+    "daily_interest",
+    "interest",
+    "payment",
+    "principal",
+    "extra_interest",
+    "ending_balance",
+)
+
+
+def expected_rows() -> list[tuple[object, ...]]:
+    return [(row[0], date.fromisoformat(row[1]), *row[2:]) for row in EXPECTED]
+
+
+def test_app_schedule_matches_snapshot():
+    rows = app.iter_schedule_rows(app.build_schedules([LOAN]))
+    assert [tuple(getattr(row, name) for name in FIELDS) for row in rows] == expected_rows()
+
+
+def test_app_par_actual_schedule_matches_snapshot():
+    schedules = app_par_actual.build_schedules([LOAN])
+    columns = {name: getattr(schedules, name).tolist() for name in FIELDS}
+    for name, missing in app_par_actual._missing_values(schedules).items():
+        if name in columns:
+            columns[name] = [
+                None if is_missing else value
+                for value, is_missing in zip(columns[name], missing.tolist())
+            ]
+    assert list(zip(*(columns[name] for name in FIELDS))) == expected_rows()